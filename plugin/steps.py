@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import os
 import shutil
+from collections.abc import Iterator
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pymupdf
@@ -16,6 +20,60 @@ from synapse_sdk.plugins.steps import BaseStep, StepResult
 from plugin.log_messages import PdfLogMessageCode
 
 
+def _render_page(
+    doc: pymupdf.Document,
+    index: int,
+    stem: str,
+    output_dir: Path,
+    output_format: str,
+    matrix: pymupdf.Matrix,
+    jpg_quality: int,
+) -> Path:
+    """Render one page of an open document and return the saved image path."""
+    pix = doc[index].get_pixmap(matrix=matrix)
+    page_path = output_dir / f'{stem}_{index:04d}.{output_format}'
+
+    # MuPDF encodes both PNG and JPEG natively; no round-trip through PIL.
+    pix.save(page_path, output=output_format, jpg_quality=jpg_quality)
+
+    return page_path
+
+
+def _render_page_range(
+    pdf_path: Path,
+    start: int,
+    stop: int,
+    output_dir: Path,
+    output_format: str,
+    dpi: int,
+    jpg_quality: int,
+) -> list[Path]:
+    """Render pages [start, stop) of a PDF; runs in a worker process.
+
+    Pages that fail to render are skipped, as in the in-process path.
+    """
+    zoom = dpi / 72.0
+    matrix = pymupdf.Matrix(zoom, zoom)
+    stem = pdf_path.stem
+
+    extracted_files: list[Path] = []
+    doc = pymupdf.open(pdf_path)
+    try:
+        for i in range(start, stop):
+            try:
+                extracted_files.append(
+                    _render_page(
+                        doc, i, stem, output_dir, output_format, matrix, jpg_quality,
+                    )
+                )
+            except Exception:
+                continue
+    finally:
+        doc.close()
+
+    return extracted_files
+
+
 class ExtractPdfImagesStep(BaseStep[UploadContext]):
     """Extract images from PDF files and replace organized_files with image entries.
 
@@ -24,11 +82,36 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
 
     Reads extra_params from context:
         - output_format (str): Output image format ('png' or 'jpg'). Default: 'png'.
-        - dpi (int): Rendering resolution in DPI. Default: 200.
+        - dpi (int): Rendering resolution in DPI, clamped to 72-600. Default: 200.
         - group_name (str | None): Group name to assign to all data units.
+        - jpg_quality (int): JPEG quality (1-100) for 'jpg' output. Default: 75.
+        - render_workers (int): Worker processes used to render the pages of
+          one PDF in parallel, clamped to 1-16 and the CPU count.
+          Default: 1 (render in-process).
     """
 
-    PDF_EXTENSIONS = {'.pdf'}
+    PDF_EXTENSIONS = frozenset({'.pdf'})
+    MIN_DPI = 72
+    MAX_DPI = 600
+    MIN_JPG_QUALITY = 1
+    MAX_JPG_QUALITY = 100
+    # PIL's default, which the former PIL-based JPEG path encoded with; MuPDF's
+    # own default (95) would make the same pages noticeably larger.
+    DEFAULT_JPG_QUALITY = 75
+    MAX_RENDER_WORKERS = 16
+    # Below this many pages, worker start-up costs more than rendering saves.
+    MIN_PARALLEL_PAGES = 16
+
+    # PyMuPDF metadata key -> data unit meta key.
+    PDF_METADATA_FIELDS = MappingProxyType({
+        'title': 'title',
+        'author': 'author',
+        'subject': 'subject',
+        'creator': 'creator',
+        'producer': 'producer',
+        'creationDate': 'creation_date',
+        'modDate': 'modification_date',
+    })
 
     @property
     def name(self) -> str:
@@ -40,43 +123,90 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
 
     def can_skip(self, context: UploadContext) -> bool:
         """Skip if no PDF files found in organized_files."""
-        for file_group in context.organized_files:
-            for file_path in file_group.get('files', {}).values():
-                if isinstance(file_path, list):
-                    file_path = file_path[0] if file_path else None
-                if file_path and Path(file_path).suffix.lower() in self.PDF_EXTENSIONS:
-                    return False
-        return True
+        return not any(
+            self._is_pdf(file_path)
+            for file_group in context.organized_files
+            for _, file_path in self._iter_file_paths(file_group.get('files', {}))
+        )
 
     def execute(self, context: UploadContext) -> StepResult:
         extra = context.params.get('extra_params') or {}
         output_format = extra.get('output_format', 'png')
-        dpi = int(extra.get('dpi', 200))
+        # Rasterization cost grows with dpi squared; keep API callers inside
+        # the same bounds the UI enforces.
+        dpi = self._clamped_int_param(extra, 'dpi', 200, self.MIN_DPI, self.MAX_DPI)
         group_name = extra.get('group_name')
+        jpg_quality = self._clamped_int_param(
+            extra, 'jpg_quality', self.DEFAULT_JPG_QUALITY, self.MIN_JPG_QUALITY, self.MAX_JPG_QUALITY,
+        )
+        render_workers = self._clamped_int_param(
+            extra, 'render_workers', 1, 1, min(self.MAX_RENDER_WORKERS, os.cpu_count() or 1),
+        )
 
         temp_dir = self._create_temp_directory(context)
         processed_files: list[dict[str, Any]] = []
         total_images_extracted = 0
+        pdf_index = 0
+
+        executor = self._create_executor(render_workers, context)
 
         try:
             for file_group in context.organized_files:
                 files_dict = file_group.get('files', {})
                 meta = file_group.get('meta', {})
 
-                for spec_name, file_path in files_dict.items():
-                    if isinstance(file_path, list):
-                        file_path = file_path[0] if file_path else None
-                    if file_path is None:
-                        continue
+                # Classify every file of the group first, then decide once per
+                # group: a group is passed through at most once, however many
+                # non-PDF specs it has.
+                pdf_files: list[tuple[str, Path]] = []
+                other_paths: dict[str, list[Path]] = {}
+                for spec_name, file_path in self._iter_file_paths(files_dict):
+                    if self._is_pdf(file_path):
+                        pdf_files.append((spec_name, file_path))
+                    else:
+                        other_paths.setdefault(spec_name, []).append(file_path)
 
-                    file_path = Path(file_path)
-                    if file_path.suffix.lower() not in self.PDF_EXTENSIONS:
-                        processed_files.append(file_group)
-                        continue
+                if not pdf_files:
+                    processed_files.append(file_group)
+                    continue
 
-                    extracted_images, pdf_metadata = self._extract_images(
-                        file_path, temp_dir, output_format, dpi, context,
-                    )
+                # Non-PDF files of a mixed group keep their own entry, item by
+                # item, so a spec listing both kinds loses none of its files.
+                other_files = {
+                    spec_name: paths[0] if len(paths) == 1 else paths
+                    for spec_name, paths in other_paths.items()
+                }
+                if other_files:
+                    processed_files.append({**file_group, 'files': other_files})
+
+                for spec_name, file_path in pdf_files:
+                    # One subdirectory per PDF under the shared temp dir, so
+                    # PDFs with the same stem cannot overwrite each other's pages.
+                    pdf_index += 1
+                    output_dir = temp_dir / f'{pdf_index:04d}'
+                    output_dir.mkdir(exist_ok=True)
+
+                    try:
+                        extracted_images, pdf_metadata = self._extract_images(
+                            file_path, output_dir, output_format, dpi, context,
+                            render_workers, jpg_quality, executor,
+                        )
+                    except BrokenExecutor as e:
+                        # A dead pool stays dead: drop it for the rest of the
+                        # step instead of failing once per remaining PDF.
+                        context.log(
+                            'pdf_parallel_render_failed',
+                            {
+                                'file': file_path.name,
+                                'reason': f'{type(e).__name__}: {e}',
+                                'fallback': 'in-process rendering for the rest of the step',
+                            },
+                        )
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = None
+                        extracted_images, pdf_metadata = self._extract_images(
+                            file_path, output_dir, output_format, dpi, context,
+                        )
 
                     if not extracted_images:
                         context.log(
@@ -86,22 +216,22 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
                         continue
 
                     page_count = len(extracted_images)
+                    # Everything but the page index is shared by all pages of
+                    # this PDF, so merge it once and copy it shallowly per page.
+                    pdf_meta: dict[str, Any] = {
+                        **meta,
+                        'origin_file_name': file_path.name,
+                        'origin_file_format': 'pdf',
+                        'origin_pdf_path': str(file_path),
+                        **pdf_metadata,
+                        'page_count': page_count,
+                        'dpi': dpi,
+                        'output_format': output_format,
+                    }
                     for i, image_path in enumerate(extracted_images):
-                        page_meta: dict[str, Any] = {
-                            **meta,
-                            'origin_file_name': file_path.name,
-                            'origin_file_format': 'pdf',
-                            'origin_pdf_path': str(file_path),
-                            **pdf_metadata,
-                            'page_count': page_count,
-                            'page_index': i + 1,
-                            'dpi': dpi,
-                            'output_format': output_format,
-                        }
-
                         entry: dict[str, Any] = {
-                            'files': {spec_name: Path(image_path)},
-                            'meta': page_meta,
+                            'files': {spec_name: image_path},
+                            'meta': {**pdf_meta, 'page_index': i + 1},
                         }
                         if group_name:
                             entry['groups'] = [group_name]
@@ -128,6 +258,9 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
 
         except Exception as e:
             return StepResult(success=False, error=f'PDF image extraction failed: {e}')
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
     def rollback(self, context: UploadContext, result: StepResult) -> None:
         temp_dir = result.rollback_data.get('temp_dir')
@@ -138,6 +271,67 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _create_executor(
+        self, render_workers: int, context: UploadContext,
+    ) -> ProcessPoolExecutor | None:
+        """Create the step's page-rendering pool, or None to render in-process.
+
+        One pool serves the whole step: spawned workers import pymupdf and the
+        SDK on start-up, so they are reused across every PDF in the batch, and
+        they only start once ranges are submitted. Hosts without working
+        semaphores reject the pool at construction; that is logged and the step
+        renders in-process instead.
+        """
+        if render_workers <= 1:
+            return None
+
+        try:
+            return ProcessPoolExecutor(
+                max_workers=render_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        except Exception as e:
+            context.log(
+                'pdf_parallel_render_unavailable',
+                {'reason': f'{type(e).__name__}: {e}', 'fallback': 'in-process rendering'},
+            )
+            return None
+
+    @staticmethod
+    def _clamped_int_param(
+        extra: dict[str, Any], key: str, default: int, low: int, high: int,
+    ) -> int:
+        """Read an integer extra param, clamped to [low, high].
+
+        The default applies only when the param is missing, empty or not an
+        integer (e.g. 'auto'), so an explicit out-of-range value (including 0)
+        is clamped, not replaced.
+        """
+        value = extra.get(key)
+        if value is None or value == '':
+            value = default
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            value = default
+        return min(max(value, low), high)
+
+    @staticmethod
+    def _iter_file_paths(files_dict: dict[str, Any]) -> Iterator[tuple[str, Path]]:
+        """Yield (spec_name, path) for each file in a group's files dict.
+
+        Every item of a list value is yielded, so multi-file specs are not
+        truncated to their first file; empty entries are skipped.
+        """
+        for spec_name, file_path in files_dict.items():
+            paths = file_path if isinstance(file_path, list) else (file_path,)
+            for path in paths:
+                if path:
+                    yield spec_name, Path(path)
+
+    def _is_pdf(self, file_path: Path) -> bool:
+        return file_path.suffix.lower() in self.PDF_EXTENSIONS
+
     def _create_temp_directory(self, context: UploadContext) -> Path:
         base = context.pathlib_cwd if context.pathlib_cwd else Path(os.getcwd())
         temp_dir = base / 'temp_pdf_images'
@@ -146,22 +340,12 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
 
     def _get_pdf_metadata(self, doc: pymupdf.Document) -> dict[str, Any]:
         """Extract metadata from a PDF document."""
-        metadata: dict[str, Any] = {}
-
         pdf_meta = doc.metadata or {}
-        meta_fields = {
-            'title': 'title',
-            'author': 'author',
-            'subject': 'subject',
-            'creator': 'creator',
-            'producer': 'producer',
-            'creationDate': 'creation_date',
-            'modDate': 'modification_date',
+        metadata: dict[str, Any] = {
+            meta_key: pdf_meta[pdf_key]
+            for pdf_key, meta_key in self.PDF_METADATA_FIELDS.items()
+            if pdf_meta.get(pdf_key)
         }
-        for pdf_key, meta_key in meta_fields.items():
-            value = pdf_meta.get(pdf_key)
-            if value:
-                metadata[meta_key] = value
 
         if doc.page_count > 0:
             first_page = doc[0]
@@ -178,14 +362,20 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
         output_format: str,
         dpi: int,
         context: UploadContext,
-    ) -> tuple[list[str], dict[str, Any]]:
+        workers: int = 1,
+        jpg_quality: int = DEFAULT_JPG_QUALITY,
+        executor: ProcessPoolExecutor | None = None,
+    ) -> tuple[list[Path], dict[str, Any]]:
         """Extract images from a single PDF file.
 
+        Pages are rendered in ``executor`` when one is given, ``workers`` > 1
+        and the PDF has at least MIN_PARALLEL_PAGES pages; otherwise in-process.
+
         Returns:
             (list of extracted image paths, PDF metadata dict)
         """
         try:
-            doc = pymupdf.open(str(pdf_path))
+            doc = pymupdf.open(pdf_path)
         except Exception:
             return [], {}
 
@@ -205,38 +395,19 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
             if total_pages == 0:
                 return [], pdf_metadata
 
-            ext = f'.{output_format}'
-            pil_format = 'jpeg' if output_format == 'jpg' else 'png'
-            stem = pdf_path.stem
-            zoom = dpi / 72.0
-            matrix = pymupdf.Matrix(zoom, zoom)
-
-            extracted_files: list[str] = []
-
-            for i in range(total_pages):
-                try:
-                    page = doc[i]
-                    pix = page.get_pixmap(matrix=matrix)
-
-                    page_filename = f'{stem}_{i:04d}{ext}'
-                    page_path = output_dir / page_filename
-
-                    if pil_format == 'png':
-                        pix.save(str(page_path))
-                    else:
-                        pix.pil_save(str(page_path), format='JPEG')
-
-                    extracted_files.append(str(page_path))
-
-                    if (i + 1) % 50 == 0:
-                        progress = ((i + 1) / total_pages) * 100
-                        context.log(
-                            'pdf_image_extraction_progress',
-                            {'file': pdf_path.name, 'pages': i + 1, 'progress': f'{progress:.1f}%'},
-                        )
-
-                except Exception:
-                    continue
+            if (
+                executor is not None
+                and workers > 1
+                and total_pages >= self.MIN_PARALLEL_PAGES
+            ):
+                extracted_files = self._render_pages_parallel(
+                    doc, pdf_path, output_dir, output_format, dpi, jpg_quality,
+                    workers, executor, context,
+                )
+            else:
+                extracted_files = self._render_pages(
+                    doc, pdf_path, output_dir, output_format, dpi, jpg_quality, context,
+                )
 
             context.log(
                 'pdf_images_extracted',
@@ -244,11 +415,126 @@ class ExtractPdfImagesStep(BaseStep[UploadContext]):
             )
             return extracted_files, pdf_metadata
 
+        except BrokenExecutor:
+            raise
         except Exception:
             return [], {}
         finally:
             doc.close()
 
+    def _render_pages(
+        self,
+        doc: pymupdf.Document,
+        pdf_path: Path,
+        output_dir: Path,
+        output_format: str,
+        dpi: int,
+        jpg_quality: int,
+        context: UploadContext,
+    ) -> list[Path]:
+        """Render every page of an open document in-process."""
+        total_pages = doc.page_count
+        zoom = dpi / 72.0
+        matrix = pymupdf.Matrix(zoom, zoom)
+
+        extracted_files: list[Path] = []
+
+        for i in range(total_pages):
+            try:
+                extracted_files.append(_render_page(
+                    doc, i, pdf_path.stem, output_dir, output_format, matrix, jpg_quality,
+                ))
+
+                if (i + 1) % 50 == 0:
+                    progress = ((i + 1) / total_pages) * 100
+                    context.log(
+                        'pdf_image_extraction_progress',
+                        {'file': pdf_path.name, 'pages': i + 1, 'progress': f'{progress:.1f}%'},
+                    )
+
+            except Exception:
+                continue
+
+        return extracted_files
+
+    def _render_pages_parallel(
+        self,
+        doc: pymupdf.Document,
+        pdf_path: Path,
+        output_dir: Path,
+        output_format: str,
+        dpi: int,
+        jpg_quality: int,
+        workers: int,
+        executor: ProcessPoolExecutor,
+        context: UploadContext,
+    ) -> list[Path]:
+        """Render a PDF's pages in worker processes, one contiguous page range each.
+
+        PyMuPDF documents cannot be shared between threads or processes, so each
+        worker opens the file itself. The executor is created by execute() with
+        spawned (not forked) workers, to stay safe inside a multi-threaded job
+        runtime.
+
+        If a range fails (worker error, spawn/import error), the failure is
+        logged and the whole document is rendered in-process instead, so a pool
+        problem never drops a PDF. A broken pool (BrokenExecutor) is re-raised
+        once in-flight ranges have settled, so execute() can stop using it.
+        """
+        total_pages = doc.page_count
+        workers = min(workers, total_pages)
+        chunk_size = -(-total_pages // workers)
+        page_ranges = [
+            (start, min(start + chunk_size, total_pages))
+            for start in range(0, total_pages, chunk_size)
+        ]
+
+        rendered: dict[int, list[Path]] = {}
+        pages_done = 0
+
+        futures: dict[Future[list[Path]], tuple[int, int]] = {}
+        try:
+            for start, stop in page_ranges:
+                future = executor.submit(
+                    _render_page_range,
+                    pdf_path, start, stop, output_dir, output_format, dpi, jpg_quality,
+                )
+                futures[future] = (start, stop)
+
+            for future in as_completed(futures):
+                start, stop = futures[future]
+                rendered[start] = future.result()
+                pages_done += stop - start
+
+                progress = (pages_done / total_pages) * 100
+                context.log(
+                    'pdf_image_extraction_progress',
+                    {'file': pdf_path.name, 'pages': pages_done, 'progress': f'{progress:.1f}%'},
+                )
+
+        except Exception as e:
+            # Let in-flight ranges finish so they cannot race the in-process
+            # render writing the same page files.
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            if isinstance(e, BrokenExecutor):
+                raise
+
+            context.log(
+                'pdf_parallel_render_failed',
+                {
+                    'file': pdf_path.name,
+                    'reason': f'{type(e).__name__}: {e}',
+                    'fallback': 'in-process rendering',
+                },
+            )
+            return self._render_pages(
+                doc, pdf_path, output_dir, output_format, dpi, jpg_quality, context,
+            )
+
+        return [path for start in sorted(rendered) for path in rendered[start]]
+
 
 class ValidateExtractedFilesStep(ValidateFilesStep):
     """Validate files and report any locked PDFs filtered out during extraction.
@@ -21,6 +21,8 @@ class UploadAction(DefaultUploadAction[UploadParams]):
     Extra params (via config.yaml ui_schema):
         - output_format: Output image format (png / jpg)
         - dpi: Rendering resolution in DPI (default: 200)
+        - jpg_quality: JPEG quality for jpg output (default: 75)
+        - render_workers: Processes rendering one PDF's pages in parallel (default: 1)
         - group_name: Group name to assign to all data units
     """
 
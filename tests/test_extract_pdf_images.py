@@ -0,0 +1,327 @@
+"""Tests for how ExtractPdfImagesStep rewrites organized_files."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pymupdf
+
+from plugin import steps
+from plugin.steps import ExtractPdfImagesStep
+
+
+class RecordingContext:
+    """Minimal context stub carrying organized_files and recording logs."""
+
+    def __init__(self, cwd: Path, organized_files: list[dict]) -> None:
+        self.pathlib_cwd = cwd
+        self.organized_files = organized_files
+        self.params: dict = {}
+        self.logs: list[tuple[str, dict]] = []
+
+    def log(self, event: str, data: dict, file: str | None = None) -> None:
+        self.logs.append((event, data))
+
+
+class UnusableExecutor:
+    """Executor stand-in that fails as soon as work is submitted."""
+
+    def submit(self, *args, **kwargs):
+        raise AssertionError('executor must not be used')
+
+
+class BrokenExecutor:
+    """Executor stand-in whose worker pool has died."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.shut_down = False
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        raise BrokenProcessPool('worker failed to start')
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.shut_down = True
+
+
+class FailingExecutor:
+    """Executor stand-in whose submitted work fails without breaking the pool."""
+
+    def submit(self, *args, **kwargs):
+        raise RuntimeError('range failed')
+
+
+def _make_pdf(path: Path, pages: int = 1) -> None:
+    """Create an unencrypted PDF with the given number of pages."""
+    doc = pymupdf.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f'page {i}')
+    doc.save(str(path))
+    doc.close()
+
+
+def test_non_pdf_group_passes_through_once(tmp_path: Path) -> None:
+    """A group with several non-PDF specs must not be duplicated."""
+    group = {
+        'files': {'image_1': tmp_path / 'a.jpg', 'image_2': tmp_path / 'b.png'},
+        'meta': {'origin': 'a'},
+    }
+    context = RecordingContext(tmp_path, [group])
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    assert context.organized_files == [group]
+
+
+def test_mixed_group_keeps_non_pdf_files_separately(tmp_path: Path) -> None:
+    """PDF pages become their own entries; other files stay in one entry."""
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path, pages=2)
+    group = {
+        'files': {'image_1': pdf_path, 'image_2': tmp_path / 'cover.jpg'},
+        'meta': {},
+    }
+    context = RecordingContext(tmp_path, [group])
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    assert result.data['images_extracted'] == 2
+    entries = context.organized_files
+    assert len(entries) == 3
+    assert entries[0]['files'] == {'image_2': tmp_path / 'cover.jpg'}
+    assert [e['meta']['page_index'] for e in entries[1:]] == [1, 2]
+    assert all(set(e['files']) == {'image_1'} for e in entries[1:])
+
+
+def test_multi_file_spec_expands_every_pdf(tmp_path: Path) -> None:
+    """Every PDF listed under one spec is rendered, not just the first."""
+    first, second = tmp_path / 'first.pdf', tmp_path / 'second.pdf'
+    _make_pdf(first)
+    _make_pdf(second)
+    group = {'files': {'image_1': [first, second]}, 'meta': {}}
+    context = RecordingContext(tmp_path, [group])
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    origins = [e['meta']['origin_file_name'] for e in context.organized_files]
+    assert origins == ['first.pdf', 'second.pdf']
+
+
+def test_multi_file_spec_keeps_non_pdf_items(tmp_path: Path) -> None:
+    """Non-PDF items listed next to a PDF under one spec are not dropped."""
+    image_path, pdf_path = tmp_path / 'b.png', tmp_path / 'c.pdf'
+    _make_pdf(pdf_path)
+    group = {'files': {'image_1': [image_path, pdf_path]}, 'meta': {}}
+    context = RecordingContext(tmp_path, [group])
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    entries = context.organized_files
+    assert entries[0]['files'] == {'image_1': image_path}
+    assert [e['files']['image_1'].name for e in entries[1:]] == ['c_0000.png']
+
+
+def test_parallel_rendering_matches_page_order(tmp_path: Path) -> None:
+    """Rendering in worker processes yields every page, in page order."""
+    pages = ExtractPdfImagesStep.MIN_PARALLEL_PAGES
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path, pages=pages)
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    context = RecordingContext(tmp_path, [])
+
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context('spawn'),
+    ) as executor:
+        images, _ = ExtractPdfImagesStep()._extract_images(
+            pdf_path, output_dir, 'png', 72, context, workers=2, executor=executor,
+        )
+
+    assert [Path(p).name for p in images] == [f'doc_{i:04d}.png' for i in range(pages)]
+    assert all(Path(p).exists() for p in images)
+
+
+def test_small_pdf_is_rendered_without_the_pool(tmp_path: Path) -> None:
+    """PDFs below MIN_PARALLEL_PAGES never submit work to the executor."""
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path, pages=2)
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    context = RecordingContext(tmp_path, [])
+
+    images, _ = ExtractPdfImagesStep()._extract_images(
+        pdf_path, output_dir, 'png', 72, context, workers=2, executor=UnusableExecutor(),
+    )
+
+    assert len(images) == 2
+
+
+def test_failed_range_falls_back_to_in_process_rendering(tmp_path: Path) -> None:
+    """A failing range is logged and the PDF is still fully rendered."""
+    pages = ExtractPdfImagesStep.MIN_PARALLEL_PAGES
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path, pages=pages)
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    context = RecordingContext(tmp_path, [])
+
+    images, _ = ExtractPdfImagesStep()._extract_images(
+        pdf_path, output_dir, 'png', 72, context, workers=2, executor=FailingExecutor(),
+    )
+
+    assert len(images) == pages
+    failures = [data for event, data in context.logs if event == 'pdf_parallel_render_failed']
+    assert len(failures) == 1
+    assert 'RuntimeError' in failures[0]['reason']
+
+
+def test_broken_pool_is_dropped_for_the_rest_of_the_step(tmp_path: Path, monkeypatch) -> None:
+    """After the pool breaks, later PDFs render in-process without retrying it."""
+    executor = BrokenExecutor()
+    monkeypatch.setattr(steps.os, 'cpu_count', lambda: 4)
+    monkeypatch.setattr(steps, 'ProcessPoolExecutor', lambda **kwargs: executor)
+    pages = ExtractPdfImagesStep.MIN_PARALLEL_PAGES
+    first, second = tmp_path / 'first.pdf', tmp_path / 'second.pdf'
+    _make_pdf(first, pages=pages)
+    _make_pdf(second, pages=pages)
+    context = RecordingContext(tmp_path, [{'files': {'image_1': [first, second]}, 'meta': {}}])
+    context.params['extra_params'] = {'render_workers': 2}
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    assert result.data['images_extracted'] == 2 * pages
+    failures = [data for event, data in context.logs if event == 'pdf_parallel_render_failed']
+    assert [f['file'] for f in failures] == ['first.pdf']
+    assert executor.submitted == 1
+    assert executor.shut_down
+
+
+def test_pool_creation_failure_renders_in_process(tmp_path: Path, monkeypatch) -> None:
+    """A host that cannot build a process pool still renders every PDF."""
+    def unavailable_pool(**kwargs):
+        raise NotImplementedError('no working semaphores')
+
+    monkeypatch.setattr(steps.os, 'cpu_count', lambda: 4)
+    monkeypatch.setattr(steps, 'ProcessPoolExecutor', unavailable_pool)
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path, pages=2)
+    context = RecordingContext(tmp_path, [{'files': {'image_1': pdf_path}, 'meta': {}}])
+    context.params['extra_params'] = {'render_workers': 2}
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    assert result.data['images_extracted'] == 2
+    assert [e for e, _ in context.logs].count('pdf_parallel_render_unavailable') == 1
+
+
+def test_jpg_output_is_written_as_jpeg(tmp_path: Path) -> None:
+    """JPG output is encoded by MuPDF directly and is a real JPEG file."""
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path)
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    context = RecordingContext(tmp_path, [])
+
+    images, _ = ExtractPdfImagesStep()._extract_images(pdf_path, output_dir, 'jpg', 72, context)
+
+    assert len(images) == 1
+    assert Path(images[0]).suffix == '.jpg'
+    assert Path(images[0]).read_bytes()[:2] == b'\xff\xd8'
+
+
+def test_out_of_range_dpi_is_clamped(tmp_path: Path) -> None:
+    """A dpi outside the UI bounds (e.g. sent via the API) is clamped."""
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path)
+    context = RecordingContext(tmp_path, [{'files': {'image_1': pdf_path}, 'meta': {}}])
+    context.params['extra_params'] = {'dpi': 5000}
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    assert context.organized_files[0]['meta']['dpi'] == ExtractPdfImagesStep.MAX_DPI
+
+
+def test_zero_params_are_clamped_not_defaulted() -> None:
+    """An explicit 0 is clamped to the lower bound instead of the default."""
+    step = ExtractPdfImagesStep()
+    extra = {'dpi': 0, 'jpg_quality': 0}
+
+    assert step._clamped_int_param(extra, 'dpi', 200, step.MIN_DPI, step.MAX_DPI) == 72
+    assert step._clamped_int_param(extra, 'jpg_quality', step.DEFAULT_JPG_QUALITY, 1, 100) == 1
+    assert step._clamped_int_param({'dpi': ''}, 'dpi', 200, step.MIN_DPI, step.MAX_DPI) == 200
+
+
+def test_non_integer_params_fall_back_to_default(tmp_path: Path) -> None:
+    """A param that is not an integer uses the default instead of failing."""
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path)
+    context = RecordingContext(tmp_path, [{'files': {'image_1': pdf_path}, 'meta': {}}])
+    context.params['extra_params'] = {'dpi': 'high', 'render_workers': 'auto'}
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    assert context.organized_files[0]['meta']['dpi'] == 200
+    assert ExtractPdfImagesStep._clamped_int_param({'render_workers': 'auto'}, 'render_workers', 1, 1, 16) == 1
+
+
+def test_pdfs_with_same_stem_do_not_collide(tmp_path: Path) -> None:
+    """Pages of same-named PDFs from different folders are kept apart."""
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+    first, second = tmp_path / 'a' / 'doc.pdf', tmp_path / 'b' / 'doc.pdf'
+    _make_pdf(first)
+    _make_pdf(second)
+    context = RecordingContext(tmp_path, [
+        {'files': {'image_1': first}, 'meta': {}},
+        {'files': {'image_1': second}, 'meta': {}},
+    ])
+
+    result = ExtractPdfImagesStep().execute(context)
+
+    assert result.success
+    paths = [e['files']['image_1'] for e in context.organized_files]
+    assert len(set(paths)) == 2
+    assert all(p.name == 'doc_0000.png' and p.exists() for p in paths)
+
+
+def test_jpg_quality_controls_output_size(tmp_path: Path) -> None:
+    """A lower jpg_quality produces a smaller JPEG for the same page."""
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path)
+    context = RecordingContext(tmp_path, [])
+    sizes = {}
+    for quality in (20, 95):
+        output_dir = tmp_path / f'q{quality}'
+        output_dir.mkdir()
+        images, _ = ExtractPdfImagesStep()._extract_images(
+            pdf_path, output_dir, 'jpg', 150, context, jpg_quality=quality,
+        )
+        sizes[quality] = Path(images[0]).stat().st_size
+
+    assert sizes[20] < sizes[95]
+
+
+def test_can_skip_only_without_pdfs(tmp_path: Path) -> None:
+    """The step is skipped only when no group contains a PDF."""
+    step = ExtractPdfImagesStep()
+    images_only = RecordingContext(tmp_path, [{'files': {'image_1': tmp_path / 'a.jpg'}}])
+    with_pdf = RecordingContext(tmp_path, [
+        {'files': {'image_1': tmp_path / 'a.jpg'}},
+        {'files': {'image_1': [tmp_path / 'b.png', tmp_path / 'c.PDF']}},
+    ])
+
+    assert step.can_skip(images_only)
+    assert not step.can_skip(with_pdf)